@@ -12,6 +12,7 @@ for logging, debugging, analytics, and monitoring pipeline behavior.
 """
 
 from dataclasses import dataclass
+from typing import Sequence
 
 from typing_extensions import TYPE_CHECKING
 
@@ -100,3 +101,15 @@ class BaseObserver(BaseObject):
             data: The event data containing details about the frame transfer.
         """
         pass
+
+    async def on_push_frames(self, data: Sequence[FramePushed]):
+        """Handle a batch of frames pushed from one processor to another.
+
+        By default, it calls `on_push_frame()` for each event in order.
+        Subclasses can override it to handle the whole batch at once.
+
+        Args:
+            data: The push events, in the order they happened.
+        """
+        for d in data:
+            await self.on_push_frame(d)
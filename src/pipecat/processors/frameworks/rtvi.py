@@ -960,6 +960,11 @@ class RTVIObserver(BaseObserver):
         self._last_user_audio_level = 0
         self._last_bot_audio_level = 0
 
+        # Frame handlers looked up by exact frame type. Handlers return whether
+        # the frame should be marked as seen. Subclasses are resolved through
+        # their MRO the first time they are seen and cached here.
+        self._frame_handlers = self._create_frame_handlers()
+
         if self._params.system_logs_enabled:
             self._system_logger_id = logger.add(self._logger_sink)
 
@@ -973,6 +978,47 @@ class RTVIObserver(BaseObserver):
                     DeprecationWarning,
                 )
 
+    def _create_frame_handlers(
+        self,
+    ) -> Dict[type, Optional[Callable[[FramePushed], Awaitable[bool]]]]:
+        """Create the frame handlers table.
+
+        Only frame types for enabled messages get a handler, so frames for
+        disabled messages are skipped with a single lookup.
+        """
+        params = self._params
+        handlers: Dict[type, Optional[Callable[[FramePushed], Awaitable[bool]]]] = {
+            RTVIServerMessageFrame: self._on_server_message_frame,
+            RTVIServerResponseFrame: self._on_server_response_frame,
+        }
+        if params.user_speaking_enabled:
+            handlers[UserStartedSpeakingFrame] = self._on_user_speaking_frame
+            handlers[UserStoppedSpeakingFrame] = self._on_user_speaking_frame
+        if params.bot_speaking_enabled:
+            handlers[BotStartedSpeakingFrame] = self._on_bot_speaking_frame
+            handlers[BotStoppedSpeakingFrame] = self._on_bot_speaking_frame
+        if params.user_transcription_enabled:
+            handlers[TranscriptionFrame] = self._on_user_transcription_frame
+            handlers[InterimTranscriptionFrame] = self._on_user_transcription_frame
+        if params.user_llm_enabled:
+            handlers[OpenAILLMContextFrame] = self._on_context_frame
+            handlers[LLMContextFrame] = self._on_context_frame
+        if params.bot_llm_enabled:
+            handlers[LLMFullResponseStartFrame] = self._on_llm_response_start_frame
+            handlers[LLMFullResponseEndFrame] = self._on_llm_response_end_frame
+            handlers[LLMTextFrame] = self._on_llm_text_frame
+        if params.bot_tts_enabled:
+            handlers[TTSStartedFrame] = self._on_tts_started_frame
+            handlers[TTSStoppedFrame] = self._on_tts_stopped_frame
+            handlers[TTSTextFrame] = self._on_tts_text_frame
+        if params.metrics_enabled:
+            handlers[MetricsFrame] = self._on_metrics_frame
+        if params.user_audio_level_enabled:
+            handlers[InputAudioRawFrame] = self._on_user_audio_frame
+        if params.bot_audio_level_enabled:
+            handlers[TTSAudioRawFrame] = self._on_bot_audio_frame
+        return handlers
+
     async def _logger_sink(self, message):
         """Logger sink so we cna send system logs to RTVI clients."""
         message = RTVISystemLogMessage(data=RTVITextMessageData(text=message))
@@ -1004,9 +1050,13 @@ class RTVIObserver(BaseObserver):
         Args:
             data: Frame push event data containing source, frame, direction, and timestamp.
         """
-        src = data.source
         frame = data.frame
-        direction = data.direction
+
+        # Frames we don't send messages for (e.g. disabled messages) are
+        # skipped before anything else.
+        handler = self._get_frame_handler(type(frame))
+        if not handler:
+            return
 
         # If we have already seen this frame, let's skip it.
         if frame.id in self._frames_seen:
@@ -1014,76 +1064,126 @@ class RTVIObserver(BaseObserver):
 
         # This tells whether the frame is already processed. If false, we will try
         # again the next time we see the frame.
-        mark_as_seen = True
-
-        if (
-            isinstance(frame, (UserStartedSpeakingFrame, UserStoppedSpeakingFrame))
-            and (direction == FrameDirection.DOWNSTREAM)
-            and self._params.user_speaking_enabled
-        ):
-            await self._handle_interruptions(frame)
-        elif (
-            isinstance(frame, (BotStartedSpeakingFrame, BotStoppedSpeakingFrame))
-            and (direction == FrameDirection.UPSTREAM)
-            and self._params.bot_speaking_enabled
-        ):
-            await self._handle_bot_speaking(frame)
-        elif (
-            isinstance(frame, (TranscriptionFrame, InterimTranscriptionFrame))
-            and self._params.user_transcription_enabled
-        ):
-            await self._handle_user_transcriptions(frame)
-        elif (
-            isinstance(frame, (OpenAILLMContextFrame, LLMContextFrame))
-            and self._params.user_llm_enabled
-        ):
-            await self._handle_context(frame)
-        elif isinstance(frame, LLMFullResponseStartFrame) and self._params.bot_llm_enabled:
-            await self.send_rtvi_message(RTVIBotLLMStartedMessage())
-        elif isinstance(frame, LLMFullResponseEndFrame) and self._params.bot_llm_enabled:
-            await self.send_rtvi_message(RTVIBotLLMStoppedMessage())
-        elif isinstance(frame, LLMTextFrame) and self._params.bot_llm_enabled:
-            await self._handle_llm_text_frame(frame)
-        elif isinstance(frame, TTSStartedFrame) and self._params.bot_tts_enabled:
-            await self.send_rtvi_message(RTVIBotTTSStartedMessage())
-        elif isinstance(frame, TTSStoppedFrame) and self._params.bot_tts_enabled:
-            await self.send_rtvi_message(RTVIBotTTSStoppedMessage())
-        elif isinstance(frame, TTSTextFrame) and self._params.bot_tts_enabled:
-            if isinstance(src, BaseOutputTransport):
-                message = RTVIBotTTSTextMessage(data=RTVITextMessageData(text=frame.text))
-                await self.send_rtvi_message(message)
-            else:
-                mark_as_seen = False
-        elif isinstance(frame, MetricsFrame) and self._params.metrics_enabled:
-            await self._handle_metrics(frame)
-        elif isinstance(frame, RTVIServerMessageFrame):
-            message = RTVIServerMessage(data=frame.data)
-            await self.send_rtvi_message(message)
-        elif isinstance(frame, RTVIServerResponseFrame):
-            if frame.error is not None:
-                await self._send_error_response(frame)
-            else:
-                await self._send_server_response(frame)
-        elif isinstance(frame, InputAudioRawFrame) and self._params.user_audio_level_enabled:
-            curr_time = time.time()
-            diff_time = curr_time - self._last_user_audio_level
-            if diff_time > self._params.audio_level_period_secs:
-                level = calculate_audio_volume(frame.audio, frame.sample_rate)
-                message = RTVIUserAudioLevelMessage(data=RTVIAudioLevelMessageData(value=level))
-                await self.send_rtvi_message(message)
-                self._last_user_audio_level = curr_time
-        elif isinstance(frame, TTSAudioRawFrame) and self._params.bot_audio_level_enabled:
-            curr_time = time.time()
-            diff_time = curr_time - self._last_bot_audio_level
-            if diff_time > self._params.audio_level_period_secs:
-                level = calculate_audio_volume(frame.audio, frame.sample_rate)
-                message = RTVIBotAudioLevelMessage(data=RTVIAudioLevelMessageData(value=level))
-                await self.send_rtvi_message(message)
-                self._last_bot_audio_level = curr_time
+        mark_as_seen = await handler(data)
 
         if mark_as_seen:
             self._frames_seen.add(frame.id)
 
+    def _get_frame_handler(
+        self, frame_type: type
+    ) -> Optional[Callable[[FramePushed], Awaitable[bool]]]:
+        """Get the handler for a frame type, resolving subclasses on first use."""
+        if frame_type in self._frame_handlers:
+            return self._frame_handlers[frame_type]
+
+        handler = None
+        for base in frame_type.__mro__[1:]:
+            handler = self._frame_handlers.get(base)
+            if handler:
+                break
+        self._frame_handlers[frame_type] = handler
+        return handler
+
+    async def _on_user_speaking_frame(self, data: FramePushed) -> bool:
+        """Handle user started/stopped speaking frames."""
+        if data.direction == FrameDirection.DOWNSTREAM:
+            await self._handle_interruptions(data.frame)
+        return True
+
+    async def _on_bot_speaking_frame(self, data: FramePushed) -> bool:
+        """Handle bot started/stopped speaking frames."""
+        if data.direction == FrameDirection.UPSTREAM:
+            await self._handle_bot_speaking(data.frame)
+        return True
+
+    async def _on_user_transcription_frame(self, data: FramePushed) -> bool:
+        """Handle user transcription frames."""
+        await self._handle_user_transcriptions(data.frame)
+        return True
+
+    async def _on_context_frame(self, data: FramePushed) -> bool:
+        """Handle LLM context frames."""
+        await self._handle_context(data.frame)
+        return True
+
+    async def _on_llm_response_start_frame(self, data: FramePushed) -> bool:
+        """Handle LLM full response start frames."""
+        await self.send_rtvi_message(RTVIBotLLMStartedMessage())
+        return True
+
+    async def _on_llm_response_end_frame(self, data: FramePushed) -> bool:
+        """Handle LLM full response end frames."""
+        await self.send_rtvi_message(RTVIBotLLMStoppedMessage())
+        return True
+
+    async def _on_llm_text_frame(self, data: FramePushed) -> bool:
+        """Handle LLM text frames."""
+        await self._handle_llm_text_frame(data.frame)
+        return True
+
+    async def _on_tts_started_frame(self, data: FramePushed) -> bool:
+        """Handle TTS started frames."""
+        await self.send_rtvi_message(RTVIBotTTSStartedMessage())
+        return True
+
+    async def _on_tts_stopped_frame(self, data: FramePushed) -> bool:
+        """Handle TTS stopped frames."""
+        await self.send_rtvi_message(RTVIBotTTSStoppedMessage())
+        return True
+
+    async def _on_tts_text_frame(self, data: FramePushed) -> bool:
+        """Handle TTS text frames once they reach the output transport."""
+        if not isinstance(data.source, BaseOutputTransport):
+            return False
+        # This is sent for every word and the fields are already valid, so
+        # skip pydantic validation.
+        message = RTVIBotTTSTextMessage.model_construct(
+            data=RTVITextMessageData.model_construct(text=data.frame.text)
+        )
+        await self.send_rtvi_message(message)
+        return True
+
+    async def _on_metrics_frame(self, data: FramePushed) -> bool:
+        """Handle metrics frames."""
+        await self._handle_metrics(data.frame)
+        return True
+
+    async def _on_server_message_frame(self, data: FramePushed) -> bool:
+        """Handle RTVI server message frames."""
+        message = RTVIServerMessage(data=data.frame.data)
+        await self.send_rtvi_message(message)
+        return True
+
+    async def _on_server_response_frame(self, data: FramePushed) -> bool:
+        """Handle RTVI server response frames."""
+        if data.frame.error is not None:
+            await self._send_error_response(data.frame)
+        else:
+            await self._send_server_response(data.frame)
+        return True
+
+    async def _on_user_audio_frame(self, data: FramePushed) -> bool:
+        """Handle user audio frames to send audio levels."""
+        curr_time = time.time()
+        diff_time = curr_time - self._last_user_audio_level
+        if diff_time > self._params.audio_level_period_secs:
+            level = calculate_audio_volume(data.frame.audio, data.frame.sample_rate)
+            message = RTVIUserAudioLevelMessage(data=RTVIAudioLevelMessageData(value=level))
+            await self.send_rtvi_message(message)
+            self._last_user_audio_level = curr_time
+        return True
+
+    async def _on_bot_audio_frame(self, data: FramePushed) -> bool:
+        """Handle bot audio frames to send audio levels."""
+        curr_time = time.time()
+        diff_time = curr_time - self._last_bot_audio_level
+        if diff_time > self._params.audio_level_period_secs:
+            level = calculate_audio_volume(data.frame.audio, data.frame.sample_rate)
+            message = RTVIBotAudioLevelMessage(data=RTVIAudioLevelMessageData(value=level))
+            await self.send_rtvi_message(message)
+            self._last_bot_audio_level = curr_time
+        return True
+
     async def _push_bot_transcription(self):
         """Push accumulated bot transcription as a message."""
         if len(self._bot_transcription) > 0:
@@ -1347,9 +1447,10 @@ class RTVIProcessor(FrameProcessor):
 
     async def push_transport_message(self, model: BaseModel, exclude_none: bool = True):
         """Push a transport message frame."""
-        frame = OutputTransportMessageUrgentFrame(
-            message=model.model_dump(exclude_none=exclude_none)
-        )
+        # Call the pydantic-core serializer directly, this is sent for every
+        # word so we skip the `model_dump()` wrapper.
+        message = model.__pydantic_serializer__.to_python(model, exclude_none=exclude_none)
+        frame = OutputTransportMessageUrgentFrame(message=message)
         await self.push_frame(frame)
 
     async def handle_message(self, message: RTVIMessage):
@@ -14,7 +14,18 @@ import asyncio
 import base64
 import json
 import uuid
-from typing import Any, AsyncGenerator, Dict, List, Literal, Mapping, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 from loguru import logger
@@ -187,12 +198,63 @@ def calculate_word_times(
         - new_partial_word: Incomplete word at end of chunk (empty if chunk ends with space)
         - new_partial_word_start_time: Start time of the incomplete word
     """
-    chars = alignment_info["chars"]
-    char_start_times_ms = alignment_info["charStartTimesMs"]
+    # Convert from milliseconds to seconds
+    char_start_times = [t / 1000.0 for t in alignment_info["charStartTimesMs"]]
+    word_times, new_partial_word, new_partial_word_start_time = _calculate_word_times(
+        alignment_info["chars"],
+        char_start_times,
+        cumulative_time,
+        partial_word,
+        partial_word_start_time,
+    )
+    if new_partial_word_start_time is None:
+        new_partial_word_start_time = 0.0
+    return (word_times, new_partial_word, new_partial_word_start_time)
+
+
+def calculate_word_times_ms(
+    alignment_info: Mapping[str, Any],
+    cumulative_time_ms: int,
+    partial_word: str = "",
+    partial_word_start_time_ms: int = 0,
+) -> tuple[List[Tuple[str, int]], str, int]:
+    """Calculate word timestamps in milliseconds from character alignment information.
+
+    Same as `calculate_word_times()`, but all times are in integer
+    milliseconds, like the ones in the alignment data, so they can be passed
+    to `add_word_timestamps_ms()` without any floating point conversion.
 
-    if len(chars) != len(char_start_times_ms):
+    Args:
+        alignment_info: Character alignment data from ElevenLabs API.
+        cumulative_time_ms: Base time offset for this chunk.
+        partial_word: Partial word carried over from previous chunk.
+        partial_word_start_time_ms: Start time of the partial word.
+
+    Returns:
+        Tuple of (word_times, new_partial_word, new_partial_word_start_time_ms).
+    """
+    word_times, new_partial_word, new_partial_word_start_time_ms = _calculate_word_times(
+        alignment_info["chars"],
+        alignment_info["charStartTimesMs"],
+        cumulative_time_ms,
+        partial_word,
+        partial_word_start_time_ms,
+    )
+    if new_partial_word_start_time_ms is None:
+        new_partial_word_start_time_ms = 0
+    return (word_times, new_partial_word, new_partial_word_start_time_ms)
+
+
+def _calculate_word_times(
+    chars: Sequence[str],
+    char_start_times: Sequence[Any],
+    cumulative_time: Any,
+    partial_word: str,
+    partial_word_start_time: Any,
+) -> tuple[List[Tuple[str, Any]], str, Any]:
+    if len(chars) != len(char_start_times):
         logger.error(
-            f"calculate_word_times: length mismatch - chars={len(chars)}, times={len(char_start_times_ms)}"
+            f"calculate_word_times: length mismatch - chars={len(chars)}, times={len(char_start_times)}"
         )
         return ([], partial_word, partial_word_start_time)
 
@@ -213,8 +275,8 @@ def calculate_word_times(
         else:
             # Building a word
             if word_start_time is None:  # First character of new word
-                # Convert from milliseconds to seconds and add cumulative offset
-                word_start_time = cumulative_time + (char_start_times_ms[i] / 1000.0)
+                # Add cumulative offset
+                word_start_time = cumulative_time + char_start_times[i]
             current_word += char
 
     # Build result for complete words
@@ -222,9 +284,8 @@ def calculate_word_times(
 
     # Return any incomplete word at the end of this chunk
     new_partial_word = current_word if current_word else ""
-    new_partial_word_start_time = word_start_time if word_start_time is not None else 0.0
 
-    return (word_times, new_partial_word, new_partial_word_start_time)
+    return (word_times, new_partial_word, word_start_time)
 
 
 class ElevenLabsTTSService(AudioContextWordTTSService):
@@ -335,10 +396,10 @@ class ElevenLabsTTSService(AudioContextWordTTSService):
         # Indicates if we have sent TTSStartedFrame. It will reset to False when
         # there's an interruption or TTSStoppedFrame.
         self._started = False
-        self._cumulative_time = 0
+        self._cumulative_time_ms = 0
         # Track partial words that span across alignment chunks
         self._partial_word = ""
-        self._partial_word_start_time = 0.0
+        self._partial_word_start_time_ms = 0
 
         # Context management for v1 multi API
         self._context_id = None
@@ -580,7 +641,7 @@ class ElevenLabsTTSService(AudioContextWordTTSService):
             self._context_id = None
             self._started = False
             self._partial_word = ""
-            self._partial_word_start_time = 0.0
+            self._partial_word_start_time_ms = 0
 
     async def _receive_messages(self):
         """Handle incoming WebSocket messages from ElevenLabs."""
@@ -620,17 +681,17 @@ class ElevenLabsTTSService(AudioContextWordTTSService):
 
             if msg.get("alignment"):
                 alignment = msg["alignment"]
-                word_times, self._partial_word, self._partial_word_start_time = (
-                    calculate_word_times(
+                word_times, self._partial_word, self._partial_word_start_time_ms = (
+                    calculate_word_times_ms(
                         alignment,
-                        self._cumulative_time,
+                        self._cumulative_time_ms,
                         self._partial_word,
-                        self._partial_word_start_time,
+                        self._partial_word_start_time_ms,
                     )
                 )
 
                 if word_times:
-                    await self.add_word_timestamps(word_times)
+                    await self.add_word_timestamps_ms(word_times)
 
                     # Calculate the actual end time of this audio chunk
                     char_start_times_ms = alignment.get("charStartTimesMs", [])
@@ -639,11 +700,10 @@ class ElevenLabsTTSService(AudioContextWordTTSService):
                     if char_start_times_ms and char_durations_ms:
                         # End time = start time of last character + duration of last character
                         chunk_end_time_ms = char_start_times_ms[-1] + char_durations_ms[-1]
-                        chunk_end_time_seconds = chunk_end_time_ms / 1000.0
-                        self._cumulative_time += chunk_end_time_seconds
+                        self._cumulative_time_ms += chunk_end_time_ms
                     else:
                         # Fallback: use the last word's start time (current behavior)
-                        self._cumulative_time = word_times[-1][1]
+                        self._cumulative_time_ms = word_times[-1][1]
                         logger.warning(
                             "_receive_messages: using fallback timing method - consider investigating alignment data structure"
                         )
@@ -700,9 +760,9 @@ class ElevenLabsTTSService(AudioContextWordTTSService):
                     await self.start_ttfb_metrics()
                     yield TTSStartedFrame()
                     self._started = True
-                    self._cumulative_time = 0
+                    self._cumulative_time_ms = 0
                     self._partial_word = ""
-                    self._partial_word_start_time = 0.0
+                    self._partial_word_start_time_ms = 0
                     # If a context ID does not exist, create a new one and
                     # register it. If an ID exists, that means the Pipeline is
                     # configured for allow_interruptions=False, so continue
@@ -20,6 +20,7 @@ from typing import (
     Tuple,
 )
 
+import numpy as np
 from loguru import logger
 
 from pipecat.frames.frames import (
@@ -50,7 +51,7 @@ from pipecat.transcriptions.language import Language
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator
 from pipecat.utils.text.base_text_filter import BaseTextFilter
 from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
-from pipecat.utils.time import seconds_to_nanoseconds
+from pipecat.utils.timestamps import clamp_monotonic
 
 
 class TTSService(AIService):
@@ -523,27 +524,99 @@ class WordTTSService(TTSService):
             **kwargs: Additional arguments passed to the parent TTSService.
         """
         super().__init__(**kwargs)
-        self._initial_word_timestamp = -1
+        # Initial word timestamp for each context. Services that synthesize
+        # only one sentence at a time use the default `None` context.
+        self._initial_word_timestamps: Dict[Optional[str], int] = {}
+        # Contexts in start order. Only the words of the first one are emitted
+        # right away, the items queued for the others are buffered until the
+        # contexts before them are done (see `_remove_word_context()`).
+        self._word_contexts: List[str] = []
+        self._buffered_word_items: Dict[str, List[Tuple]] = {}
+        self._last_word_pts = 0
         self._words_task = None
         self._llm_response_started: bool = False
 
-    def start_word_timestamps(self):
-        """Start tracking word timestamps from the current time."""
-        if self._initial_word_timestamp == -1:
-            self._initial_word_timestamp = self.get_clock().get_time()
+    def start_word_timestamps(self, context_id: Optional[str] = None, now_ns: Optional[int] = None):
+        """Start tracking word timestamps from the current time.
 
-    def reset_word_timestamps(self):
-        """Reset word timestamp tracking."""
-        self._initial_word_timestamp = -1
+        This is usually called for every audio chunk received, but the clock
+        is only read the first time for each context.
 
-    async def add_word_timestamps(self, word_times: List[Tuple[str, float]]):
+        Args:
+            context_id: Context (e.g. sentence) the following word timestamps
+                belong to. Each context keeps its own initial timestamp, so
+                multiple contexts can be synthesized at the same time. Words
+                are emitted one context at a time, in start order, so each
+                context must be finished with a "TTSStoppedFrame" or "Reset"
+                word timestamp.
+            now_ns: Current clock time in nanoseconds, if the caller already
+                has it. Otherwise, the clock is read.
+        """
+        if context_id not in self._initial_word_timestamps:
+            if now_ns is None:
+                now_ns = self.get_clock().get_time()
+            self._initial_word_timestamps[context_id] = now_ns
+            if context_id is not None:
+                if self._word_contexts:
+                    self._buffered_word_items[context_id] = []
+                self._word_contexts.append(context_id)
+
+    def reset_word_timestamps(self, context_id: Optional[str] = None):
+        """Reset word timestamp tracking.
+
+        Args:
+            context_id: Context to reset. Its pending words are dropped and
+                the next context, in start order, can be emitted. If not
+                given, all contexts are reset, and so is the last emitted
+                timestamp new words are clamped to.
+        """
+        if context_id is None:
+            self._initial_word_timestamps.clear()
+            self._word_contexts.clear()
+            self._buffered_word_items.clear()
+            self._last_word_pts = 0
+        else:
+            self._initial_word_timestamps.pop(context_id, None)
+            self._remove_word_context(context_id)
+
+    async def add_word_timestamps(
+        self, word_times: List[Tuple[str, float]], context_id: Optional[str] = None
+    ):
         """Add word timestamps to the processing queue.
 
+        The whole batch is converted to nanoseconds in a single vectorized pass
+        and queued as two parallel columns (words and timestamps).
+
         Args:
             word_times: List of (word, timestamp) tuples where timestamp is in seconds.
+            context_id: Context the timestamps are relative to.
         """
-        for word, timestamp in word_times:
-            await self._words_queue.put((word, seconds_to_nanoseconds(timestamp)))
+        if not word_times:
+            return
+        words, timestamps = zip(*word_times)
+        timestamps_ns = (np.asarray(timestamps, dtype=np.float64) * 1_000_000_000).astype(np.int64)
+        await self._queue_word_timestamps(words, timestamps_ns, context_id)
+
+    async def add_word_timestamps_ms(
+        self, word_times: List[Tuple[str, int]], context_id: Optional[str] = None
+    ):
+        """Add word timestamps in milliseconds to the processing queue.
+
+        Prefer this over `add_word_timestamps()` when the service already
+        provides integer milliseconds: the conversion to nanoseconds is integer
+        only, so there's no floating point rounding. Fractional milliseconds
+        are truncated, use `add_word_timestamps()` for those.
+
+        Args:
+            word_times: List of (word, timestamp) tuples where timestamp is in
+                integer milliseconds.
+            context_id: Context the timestamps are relative to.
+        """
+        if not word_times:
+            return
+        words, timestamps = zip(*word_times)
+        timestamps_ns = np.asarray(timestamps, dtype=np.int64) * 1_000_000
+        await self._queue_word_timestamps(words, timestamps_ns, context_id)
 
     async def start(self, frame: StartFrame):
         """Start the word TTS service.
@@ -601,26 +674,91 @@ class WordTTSService(TTSService):
             await self.cancel_task(self._words_task)
             self._words_task = None
 
-    async def _words_task_handler(self):
-        last_pts = 0
-        while True:
+    async def _queue_word_timestamps(
+        self, words: Sequence[str], timestamps_ns: np.ndarray, context_id: Optional[str]
+    ):
+        # Control words ("Reset" and "TTSStoppedFrame" with a 0 timestamp) are
+        # queued on their own so they keep their position relative to the
+        # spoken words. They are found with a single mask over the batch.
+        controls = (timestamps_ns == 0) & np.isin(words, ("Reset", "TTSStoppedFrame"))
+        start = 0
+        for i in np.flatnonzero(controls).tolist():
+            if i > start:
+                await self._words_queue.put((words[start:i], timestamps_ns[start:i], context_id))
+            await self._words_queue.put((words[i], None, context_id))
+            start = i + 1
+        if start < len(words):
+            await self._words_queue.put((words[start:], timestamps_ns[start:], context_id))
+
+    def _word_timestamps_to_pts(self, timestamps: np.ndarray, context_id: Optional[str]):
+        initial_word_timestamp = self._initial_word_timestamps.get(context_id, -1)
+        # The queued timestamps array is owned by its batch, so turn the
+        # relative timestamps into absolute ones in place.
+        return np.add(timestamps, initial_word_timestamp, out=timestamps)
+
+    def _remove_word_context(self, context_id: str):
+        if context_id not in self._word_contexts:
+            return
+        was_first = self._word_contexts[0] == context_id
+        self._word_contexts.remove(context_id)
+        self._buffered_word_items.pop(context_id, None)
+        if was_first and self._word_contexts:
+            # The next context can now be emitted. If it has buffered items,
+            # the words task releases them (see `_release_word_context()`).
+            if self._buffered_word_items[self._word_contexts[0]]:
+                self._words_queue.put_nowait(None)
+            else:
+                del self._buffered_word_items[self._word_contexts[0]]
+
+    async def _release_word_context(self):
+        if self._word_contexts:
+            items = self._buffered_word_items.pop(self._word_contexts[0], [])
+            for item in items:
+                await self._handle_word_item(item)
+
+    async def _handle_word_item(self, item: Tuple):
+        (words, timestamps, context_id) = item
+        if timestamps is None:
             frame = None
-            (word, timestamp) = await self._words_queue.get()
-            if word == "Reset" and timestamp == 0:
-                self.reset_word_timestamps()
+            if words == "Reset":
+                self.reset_word_timestamps(context_id)
                 if self._llm_response_started:
                     self._llm_response_started = False
                     frame = LLMFullResponseEndFrame()
-                    frame.pts = last_pts
-            elif word == "TTSStoppedFrame" and timestamp == 0:
+                    frame.pts = self._last_word_pts
+            elif words == "TTSStoppedFrame":
                 frame = TTSStoppedFrame()
-                frame.pts = last_pts
-            else:
-                frame = TTSTextFrame(word)
-                frame.pts = self._initial_word_timestamp + timestamp
+                frame.pts = self._last_word_pts
+                if context_id is not None:
+                    self.reset_word_timestamps(context_id)
             if frame:
-                last_pts = frame.pts
                 await self.push_frame(frame)
+            return
+
+        pts = self._word_timestamps_to_pts(timestamps, context_id).tolist()
+
+        # Emitted words must be strictly increasing, clamp the ones that are
+        # not. The floor is the last emitted word, whatever its context.
+        self._last_word_pts, index = clamp_monotonic(pts, self._last_word_pts)
+        if index >= 0:
+            logger.warning(
+                f"{self} non-monotonic word timestamp, '{words[index]}' clamped to {pts[index]}"
+            )
+        for word, word_pts in zip(words, pts):
+            frame = TTSTextFrame(word)
+            frame.pts = word_pts
+            await self.push_frame(frame)
+
+    async def _words_task_handler(self):
+        while True:
+            item = await self._words_queue.get()
+            if item is None:
+                await self._release_word_context()
+            elif item[2] in self._buffered_word_items:
+                # A previous context is still being emitted.
+                self._buffered_word_items[item[2]].append(item)
+            else:
+                await self._handle_word_item(item)
             self._words_queue.task_done()
 
 
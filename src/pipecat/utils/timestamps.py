@@ -0,0 +1,41 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Timestamp sequence utilities for word-level synchronization.
+
+This module provides helpers to validate and fix sequences of presentation
+timestamps (PTS), in nanoseconds, such as the ones generated from TTS word
+timestamps. Word batches only hold a handful of timestamps, so the helpers
+are plain Python and don't need any compilation.
+"""
+
+from typing import List, Tuple
+
+
+def clamp_monotonic(pts: List[int], prev: int) -> Tuple[int, int]:
+    """Clamp timestamps in place so they are strictly increasing.
+
+    Each timestamp becomes the maximum of itself and the previous clamped
+    timestamp plus one (`prev` is used for the first one). Checking and
+    clamping are done in a single pass over `pts`.
+
+    Args:
+        pts: Timestamps in nanoseconds. Modified in place.
+        prev: The timestamp that precedes the first element of `pts`.
+
+    Returns:
+        A tuple with the last clamped timestamp and the index of the first
+        timestamp that had to be clamped (-1 if none).
+    """
+    first_clamped = -1
+    for i, t in enumerate(pts):
+        if t <= prev:
+            if first_clamped < 0:
+                first_clamped = i
+            t = prev + 1
+            pts[i] = t
+        prev = t
+    return prev, first_clamped
@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+from pipecat.services.elevenlabs.tts import calculate_word_times, calculate_word_times_ms
+
+
+def alignment(text: str, start_ms: int, step_ms: int = 100):
+    return {
+        "chars": list(text),
+        "charStartTimesMs": [start_ms + i * step_ms for i in range(len(text))],
+    }
+
+
+class TestCalculateWordTimes(unittest.TestCase):
+    def test_word_times_in_seconds(self):
+        word_times, partial_word, partial_word_start_time = calculate_word_times(
+            alignment("Hello world ", 0), cumulative_time=1.5
+        )
+        self.assertEqual(word_times, [("Hello", 1.5), ("world", 2.1)])
+        self.assertEqual(partial_word, "")
+        self.assertEqual(partial_word_start_time, 0.0)
+
+    def test_word_times_in_milliseconds(self):
+        word_times, partial_word, partial_word_start_time_ms = calculate_word_times_ms(
+            alignment("Hello world ", 0), cumulative_time_ms=1500
+        )
+        self.assertEqual(word_times, [("Hello", 1500), ("world", 2100)])
+        self.assertTrue(all(type(t) is int for _, t in word_times))
+        self.assertEqual(partial_word, "")
+        self.assertEqual(partial_word_start_time_ms, 0)
+
+    def test_partial_word_across_chunks(self):
+        word_times, partial_word, partial_word_start_time_ms = calculate_word_times_ms(
+            alignment("Hello wo", 0), 1000
+        )
+        self.assertEqual(word_times, [("Hello", 1000)])
+        self.assertEqual((partial_word, partial_word_start_time_ms), ("wo", 1600))
+
+        # The chunk starts with the rest of the word.
+        word_times, partial_word, partial_word_start_time_ms = calculate_word_times_ms(
+            alignment("rld again", 0), 1800, partial_word, partial_word_start_time_ms
+        )
+        self.assertEqual(word_times, [("world", 1600)])
+        self.assertEqual((partial_word, partial_word_start_time_ms), ("again", 2200))
+
+    def test_length_mismatch(self):
+        info = {"chars": ["a", "b"], "charStartTimesMs": [0]}
+        self.assertEqual(calculate_word_times_ms(info, 0, "wo", 300), ([], "wo", 300))
+
+
+if __name__ == "__main__":
+    unittest.main()
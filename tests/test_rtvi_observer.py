@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+from collections import deque
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from pipecat.frames.frames import LLMTextFrame, TTSStartedFrame, TTSTextFrame
+from pipecat.observers.base_observer import FramePushed
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.processors.frameworks.rtvi import RTVIObserver, RTVIObserverParams
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import TransportParams
+
+
+@dataclass
+class CustomTTSStartedFrame(TTSStartedFrame):
+    pass
+
+
+class MockRTVIObserver(RTVIObserver):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.messages_sent = deque()
+
+    async def send_rtvi_message(self, model: BaseModel, exclude_none: bool = True):
+        self.messages_sent.append(model.model_dump(exclude_none=exclude_none))
+
+
+def frame_pushed(frame, source=None, direction=FrameDirection.DOWNSTREAM) -> FramePushed:
+    return FramePushed(
+        source=source, destination=None, frame=frame, direction=direction, timestamp=0
+    )
+
+
+class TestRTVIObserver(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.transport = BaseOutputTransport(TransportParams())
+
+    async def test_tts_text_from_output_transport(self):
+        observer = MockRTVIObserver()
+
+        await observer.on_push_frame(frame_pushed(TTSTextFrame("Hello")))
+        self.assertEqual(list(observer.messages_sent), [])
+
+        # The frame was not marked as seen, so it's sent once it reaches the
+        # output transport.
+        frame = TTSTextFrame("Hello")
+        await observer.on_push_frame(frame_pushed(frame))
+        await observer.on_push_frame(frame_pushed(frame, source=self.transport))
+        await observer.on_push_frame(frame_pushed(frame, source=self.transport))
+        self.assertEqual(
+            list(observer.messages_sent),
+            [{"label": "rtvi-ai", "type": "bot-tts-text", "data": {"text": "Hello"}}],
+        )
+
+    async def test_frame_subclasses_are_handled(self):
+        observer = MockRTVIObserver()
+
+        await observer.on_push_frame(frame_pushed(CustomTTSStartedFrame()))
+        await observer.on_push_frame(frame_pushed(CustomTTSStartedFrame()))
+        self.assertEqual([m["type"] for m in observer.messages_sent], ["bot-tts-started"] * 2)
+
+    async def test_push_frames_batch(self):
+        observer = MockRTVIObserver()
+
+        words = ["Hello", "there", "world"]
+        await observer.on_push_frames(
+            [frame_pushed(TTSTextFrame(word), source=self.transport) for word in words]
+        )
+        self.assertEqual([m["data"]["text"] for m in observer.messages_sent], words)
+
+    async def test_disabled_messages(self):
+        observer = MockRTVIObserver(
+            params=RTVIObserverParams(bot_tts_enabled=False, bot_llm_enabled=False)
+        )
+
+        await observer.on_push_frame(frame_pushed(TTSStartedFrame()))
+        await observer.on_push_frame(frame_pushed(TTSTextFrame("Hello"), source=self.transport))
+        await observer.on_push_frame(frame_pushed(LLMTextFrame("Hello")))
+        self.assertEqual(list(observer.messages_sent), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
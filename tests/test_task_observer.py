@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.frames.frames import TextFrame
+from pipecat.observers.base_observer import BaseObserver, FrameProcessed, FramePushed
+from pipecat.pipeline.task_observer import TaskObserver
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.utils.asyncio.task_manager import TaskManager, TaskManagerParams
+
+
+class RecordingObserver(BaseObserver):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.events = []
+
+    async def on_push_frame(self, data: FramePushed):
+        self.events.append(("push", data.frame.text))
+
+    async def on_process_frame(self, data: FrameProcessed):
+        self.events.append(("process", data.frame.text))
+
+
+def frame_pushed(text: str) -> FramePushed:
+    return FramePushed(
+        source=None,
+        destination=None,
+        frame=TextFrame(text),
+        direction=FrameDirection.DOWNSTREAM,
+        timestamp=0,
+    )
+
+
+def frame_processed(text: str) -> FrameProcessed:
+    return FrameProcessed(
+        processor=None, frame=TextFrame(text), direction=FrameDirection.DOWNSTREAM, timestamp=0
+    )
+
+
+class TestTaskObserver(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        task_manager = TaskManager()
+        task_manager.setup(TaskManagerParams(loop=asyncio.get_running_loop()))
+        self.observer = RecordingObserver()
+        self.task_observer = TaskObserver(observers=[self.observer], task_manager=task_manager)
+        await self.task_observer.start()
+
+    async def asyncTearDown(self):
+        await self.task_observer.stop()
+
+    async def _wait_for_observer(self):
+        queue = self.task_observer._proxies[self.observer].queue
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    async def test_events_are_delivered_in_order(self):
+        await self.task_observer.on_push_frame(frame_pushed("one"))
+        await self.task_observer.on_push_frame(frame_pushed("two"))
+        await self.task_observer.on_process_frame(frame_processed("three"))
+        await self.task_observer.on_push_frame(frame_pushed("four"))
+        await self._wait_for_observer()
+
+        self.assertEqual(
+            self.observer.events,
+            [("push", "one"), ("push", "two"), ("process", "three"), ("push", "four")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
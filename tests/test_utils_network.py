@@ -9,8 +9,8 @@ import unittest
 from pipecat.utils.network import exponential_backoff_time
 
 
-class TestUtilsNetwork(unittest.IsolatedAsyncioTestCase):
-    async def test_exponential_backoff_time(self):
+class TestUtilsNetwork(unittest.TestCase):
+    def test_exponential_backoff_time(self):
         # min_wait=4, max_wait=10, multiplier=1
         assert exponential_backoff_time(attempt=1, min_wait=4, max_wait=10, multiplier=1) == 4
         assert exponential_backoff_time(attempt=2, min_wait=4, max_wait=10, multiplier=1) == 4
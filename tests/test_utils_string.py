@@ -9,8 +9,8 @@ import unittest
 from pipecat.utils.string import match_endofsentence, parse_start_end_tags
 
 
-class TestUtilsString(unittest.IsolatedAsyncioTestCase):
-    async def test_endofsentence(self):
+class TestUtilsString(unittest.TestCase):
+    def test_endofsentence(self):
         assert match_endofsentence("This is a sentence.") == 19
         assert match_endofsentence("This is a sentence!") == 19
         assert match_endofsentence("This is a sentence?") == 19
@@ -43,7 +43,7 @@ class TestUtilsString(unittest.IsolatedAsyncioTestCase):
         assert not match_endofsentence("My emails are foo@pipecat.ai and bar@pipecat.ai")
         assert not match_endofsentence("The number pi is 3.14159")
 
-    async def test_endofsentence_multilingual(self):
+    def test_endofsentence_multilingual(self):
         """Test sentence detection across various language families and scripts."""
 
         # Arabic script (Arabic, Urdu, Persian)
@@ -153,7 +153,7 @@ class TestUtilsString(unittest.IsolatedAsyncioTestCase):
         for sentence in latin_script_sentences:
             assert match_endofsentence(sentence), f"Failed for Latin script: {sentence}"
 
-    async def test_endofsentence_streaming_tokens(self):
+    def test_endofsentence_streaming_tokens(self):
         """Test the specific use case of streaming LLM tokens."""
 
         # These are the scenarios that were problematic with the original regex
@@ -187,12 +187,12 @@ class TestUtilsString(unittest.IsolatedAsyncioTestCase):
         )
 
 
-class TestStartEndTags(unittest.IsolatedAsyncioTestCase):
-    async def test_empty(self):
+class TestStartEndTags(unittest.TestCase):
+    def test_empty(self):
         assert parse_start_end_tags("", [], None, 0) == (None, 0)
         assert parse_start_end_tags("Hello from Pipecat!", [], None, 0) == (None, 0)
 
-    async def test_simple(self):
+    def test_simple(self):
         # (<a>, </a>)
         assert parse_start_end_tags("Hello from <a>Pipecat</a>!", [("<a>", "</a>")], None, 0) == (
             None,
@@ -217,7 +217,7 @@ class TestStartEndTags(unittest.IsolatedAsyncioTestCase):
             24,
         )
 
-    async def test_multiple(self):
+    def test_multiple(self):
         # (<a>, </a>)
         assert parse_start_end_tags(
             "Hello from <a>Pipecat</a>! Hello <a>World</a>!", [("<a>", "</a>")], None, 0
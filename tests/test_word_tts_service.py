@@ -0,0 +1,255 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.clocks.base_clock import BaseClock
+from pipecat.frames.frames import (
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.tts_service import WordTTSService
+
+
+class MockClock(BaseClock):
+    def __init__(self, time_ns: int = 0):
+        self.current_time_ns = time_ns
+
+    def get_time(self) -> int:
+        return self.current_time_ns
+
+    def start(self):
+        pass
+
+    def advance_ns(self, ns: int):
+        self.current_time_ns += ns
+
+
+class MockWordTTSService(WordTTSService):
+    def __init__(self, **kwargs):
+        super().__init__(push_text_frames=False, **kwargs)
+        self.pushed_frames = []
+
+    async def push_frame(self, frame, direction=FrameDirection.DOWNSTREAM):
+        self.pushed_frames.append(frame)
+
+    async def run_tts(self, text: str):
+        yield TTSStoppedFrame()
+
+
+class TestWordTTSService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.clock = MockClock(time_ns=1_000_000_000)
+        self.tts = MockWordTTSService()
+        self.tts._clock = self.clock
+        self.tts._words_queue = asyncio.Queue()
+        self.words_task = asyncio.create_task(self.tts._words_task_handler())
+
+    async def asyncTearDown(self):
+        self.words_task.cancel()
+        try:
+            await self.words_task
+        except asyncio.CancelledError:
+            pass
+
+    async def _wait_for_words(self):
+        await asyncio.wait_for(self.tts._words_queue.join(), timeout=1)
+
+    def _text_frames(self):
+        return [f for f in self.tts.pushed_frames if isinstance(f, TTSTextFrame)]
+
+    async def test_word_timestamps_are_relative_to_start(self):
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("Hello", 0.0), ("world", 0.25), ("again", 1.5)])
+        await self._wait_for_words()
+
+        frames = self._text_frames()
+        self.assertEqual([f.text for f in frames], ["Hello", "world", "again"])
+        self.assertEqual([f.pts for f in frames], [1_000_000_000, 1_250_000_000, 2_500_000_000])
+        self.assertTrue(all(type(f.pts) is int for f in frames))
+
+    async def test_start_word_timestamps_with_time(self):
+        self.tts.start_word_timestamps(now_ns=5_000_000_000)
+        # Already started, the given time is ignored.
+        self.tts.start_word_timestamps(now_ns=6_000_000_000)
+        await self.tts.add_word_timestamps([("Hello", 0.5)])
+        await self._wait_for_words()
+
+        self.assertEqual([f.pts for f in self._text_frames()], [5_500_000_000])
+
+    async def test_word_timestamps_in_milliseconds(self):
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps_ms(
+            [("Hello", 0), ("world", 300), ("TTSStoppedFrame", 0)]
+        )
+        await self._wait_for_words()
+
+        frames = self._text_frames()
+        self.assertEqual([f.pts for f in frames], [1_000_000_000, 1_300_000_000])
+        self.assertIsInstance(self.tts.pushed_frames[-1], TTSStoppedFrame)
+
+    async def test_multiple_sentences_timestamps(self):
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("First", 0.0), ("sentence", 0.5)])
+        await self.tts.add_word_timestamps([("TTSStoppedFrame", 0), ("Reset", 0)])
+        await self._wait_for_words()
+
+        self.clock.advance_ns(2_000_000_000)
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("Second", 0.0), ("sentence", 0.5)])
+        await self._wait_for_words()
+
+        pts = [f.pts for f in self._text_frames()]
+        self.assertEqual(pts, [1_000_000_000, 1_500_000_000, 3_000_000_000, 3_500_000_000])
+        self.assertEqual(pts, sorted(set(pts)))
+
+        stopped = [f for f in self.tts.pushed_frames if isinstance(f, TTSStoppedFrame)]
+        self.assertEqual(len(stopped), 1)
+        self.assertEqual(stopped[0].pts, 1_500_000_000)
+
+    async def test_contexts_are_emitted_in_start_order(self):
+        self.tts.start_word_timestamps("a")
+        self.clock.advance_ns(1_000_000_000)
+        self.tts.start_word_timestamps("b")
+
+        # Context "b" words are processed before any word of context "a".
+        await self.tts.add_word_timestamps([("Second", 0.0), ("sentence", 0.25)], "b")
+        await self._wait_for_words()
+        self.assertEqual(self._text_frames(), [])
+
+        await self.tts.add_word_timestamps([("First", 0.0), ("one", 0.5)], "a")
+        await self._wait_for_words()
+        self.assertEqual([f.text for f in self._text_frames()], ["First", "one"])
+
+        await self.tts.add_word_timestamps([("TTSStoppedFrame", 0)], "a")
+        await self._wait_for_words()
+
+        frames = self._text_frames()
+        self.assertEqual([f.text for f in frames], ["First", "one", "Second", "sentence"])
+        self.assertEqual(
+            [f.pts for f in frames], [1_000_000_000, 1_500_000_000, 2_000_000_000, 2_250_000_000]
+        )
+        self.assertIsInstance(self.tts.pushed_frames[2], TTSStoppedFrame)
+
+    async def test_finished_buffered_contexts_are_released(self):
+        for context_id in ("a", "b", "c"):
+            self.tts.start_word_timestamps(context_id)
+            self.clock.advance_ns(1_000_000_000)
+
+        await self.tts.add_word_timestamps([("Three", 0.0)], "c")
+        await self.tts.add_word_timestamps([("Two", 0.0), ("TTSStoppedFrame", 0)], "b")
+        await self.tts.add_word_timestamps([("One", 0.0), ("TTSStoppedFrame", 0)], "a")
+        await self._wait_for_words()
+
+        frames = self._text_frames()
+        self.assertEqual([f.text for f in frames], ["One", "Two", "Three"])
+        self.assertEqual([f.pts for f in frames], [1_000_000_000, 2_000_000_000, 3_000_000_000])
+
+    async def test_reset_context_releases_next_context(self):
+        self.tts.start_word_timestamps("a")
+        self.clock.advance_ns(1_000_000_000)
+        self.tts.start_word_timestamps("b")
+
+        await self.tts.add_word_timestamps([("Second", 0.0)], "b")
+        await self._wait_for_words()
+        self.assertEqual(self._text_frames(), [])
+
+        self.tts.reset_word_timestamps("a")
+        await self.tts.add_word_timestamps([("sentence", 0.25), ("TTSStoppedFrame", 0)], "b")
+        await self._wait_for_words()
+
+        frames = self._text_frames()
+        self.assertEqual([f.text for f in frames], ["Second", "sentence"])
+        self.assertEqual([f.pts for f in frames], [2_000_000_000, 2_250_000_000])
+
+    async def test_finished_contexts_are_removed(self):
+        for i in range(3):
+            self.tts.start_word_timestamps(f"c{i}")
+            await self.tts.add_word_timestamps([("word", 0.0), ("TTSStoppedFrame", 0)], f"c{i}")
+            await self._wait_for_words()
+            self.clock.advance_ns(1_000_000_000)
+
+        self.assertEqual(self.tts._initial_word_timestamps, {})
+        self.assertEqual(self.tts._word_contexts, [])
+
+        # A reused context starts from the current time again.
+        self.tts.start_word_timestamps("c0")
+        await self.tts.add_word_timestamps([("again", 0.0)], "c0")
+        await self._wait_for_words()
+        self.assertEqual(self._text_frames()[-1].pts, 4_000_000_000)
+
+    async def test_non_monotonic_word_timestamps_are_clamped(self):
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("one", 0.5), ("two", 0.5), ("three", 0.2)])
+        await self._wait_for_words()
+
+        pts = [f.pts for f in self._text_frames()]
+        self.assertEqual(pts, [1_500_000_000, 1_500_000_001, 1_500_000_002])
+
+    async def test_non_monotonic_word_timestamps_are_clamped_across_batches(self):
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("one", 0.5), ("two", 0.75)])
+        await self._wait_for_words()
+        await self.tts.add_word_timestamps([("three", 0.25), ("four", 1.0)])
+        await self._wait_for_words()
+
+        pts = [f.pts for f in self._text_frames()]
+        self.assertEqual(pts, [1_500_000_000, 1_750_000_000, 1_750_000_001, 2_000_000_000])
+
+    async def test_non_monotonic_word_timestamps_are_clamped_across_contexts(self):
+        self.tts.start_word_timestamps("a")
+        self.clock.advance_ns(200_000_000)
+        self.tts.start_word_timestamps("b")
+
+        await self.tts.add_word_timestamps([("three", 0.0), ("four", 0.5)], "b")
+        await self.tts.add_word_timestamps(
+            [("one", 0.0), ("two", 0.5), ("TTSStoppedFrame", 0)], "a"
+        )
+        await self._wait_for_words()
+
+        # The floor is the previous emitted word, so context "b" words are
+        # clamped after the last word of context "a".
+        frames = self._text_frames()
+        self.assertEqual([f.text for f in frames], ["one", "two", "three", "four"])
+        self.assertEqual(
+            [f.pts for f in frames], [1_000_000_000, 1_500_000_000, 1_500_000_001, 1_700_000_000]
+        )
+
+    async def test_interruption_resets_clamped_timestamps(self):
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([(f"old{i}", float(i)) for i in range(10)])
+        await self._wait_for_words()
+
+        # The user interrupts while the old words are still in the future.
+        self.clock.advance_ns(3_000_000_000)
+        await self.tts._handle_interruption(InterruptionFrame(), FrameDirection.DOWNSTREAM)
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("new1", 0.0), ("new2", 0.5), ("new3", 1.0)])
+        await self._wait_for_words()
+
+        pts = [f.pts for f in self._text_frames() if f.text.startswith("new")]
+        self.assertEqual(pts, [4_000_000_000, 4_500_000_000, 5_000_000_000])
+
+    async def test_reset_ends_llm_response(self):
+        self.tts._llm_response_started = True
+        self.tts.start_word_timestamps()
+        await self.tts.add_word_timestamps([("Hello", 0.1), ("Reset", 0)])
+        await self._wait_for_words()
+
+        self.assertIsInstance(self.tts.pushed_frames[-1], LLMFullResponseEndFrame)
+        self.assertEqual(self.tts.pushed_frames[-1].pts, 1_100_000_000)
+
+    async def test_empty_word_timestamps(self):
+        await self.tts.add_word_timestamps([])
+        self.assertTrue(self.tts._words_queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()